@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
@@ -6,7 +6,7 @@ from app.engine.analysis import MultiTimeframeAnalyzer
 from app.models.tables import AppSettings, Backtest, FeatureSnapshot, PositionsSnapshot, Signal
 from app.schemas.api import AnalyzeResponse, BacktestRequest, SettingsPayload
 from app.services.ai_client import infer_probability
-from app.services.etoro_client import EtoroClient
+from app.services.etoro_client import EtoroApiError, EtoroClient
 from app.services.market_data import synthetic_candles
 from app.services.session_filter import get_session_score
 
@@ -76,12 +76,18 @@ def update_settings(payload: SettingsPayload, db: Session = Depends(get_db)) ->
 
 @router.get("/account")
 async def account() -> dict:
-    return await EtoroClient().get_account()
+    try:
+        return await EtoroClient().get_account()
+    except EtoroApiError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
 
 
 @router.get("/positions")
 async def positions(db: Session = Depends(get_db)) -> dict:
-    data = await EtoroClient().get_positions()
+    try:
+        data = await EtoroClient().get_positions()
+    except EtoroApiError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
     db.add(PositionsSnapshot(positions=data))
     db.commit()
     return data
@@ -98,9 +104,10 @@ async def analyze(db: Session = Depends(get_db)) -> AnalyzeResponse:
     analyzer = MultiTimeframeAnalyzer(min_rr=runtime.min_rr)
     session_score = get_session_score() if runtime.session_filter else 1.0
     features = analyzer.build_features(h4, h1, m15, session_score)
-    ai_probability = await infer_probability(features)
+    ai_probability, ai_fallback = await infer_probability(features)
     signal = analyzer.evaluate_signal(features, ai_probability, float(m15.iloc[-1]["close"]))
     signal["valid"] = signal["valid"] and ai_probability >= runtime.min_ai_probability
+    signal["ai_fallback"] = ai_fallback
 
     db.add(FeatureSnapshot(timeframe="M15", features=features))
     db.add(
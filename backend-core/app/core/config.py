@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     etoro_client_id: str = "demo-client"
     etoro_client_secret: str = "demo-secret"
     etoro_refresh_token: str = "demo-refresh"
+    etoro_http_enabled: bool = False
     ai_engine_url: str = "http://ai-engine:8001"
 
     def load_runtime_config(self) -> RuntimeConfig:
@@ -1,15 +1,22 @@
+import logging
+
 import httpx
 
 from app.core.config import get_settings
 
+logger = logging.getLogger("ai-client")
+
+FALLBACK_PROBABILITY = 0.5
+
 
-async def infer_probability(features: dict) -> float:
+async def infer_probability(features: dict) -> tuple[float, bool]:
     settings = get_settings()
     try:
         async with httpx.AsyncClient(timeout=20) as client:
             response = await client.post(f"{settings.ai_engine_url}/infer", json={"features": features})
             response.raise_for_status()
-            return float(response.json().get("probability", 0.5))
-    except Exception:
+            return float(response.json().get("probability", FALLBACK_PROBABILITY)), False
+    except Exception as exc:
         # Fallback verhindert Analyse-Abbruch falls AI-Service kurzzeitig nicht verfügbar ist.
-        return 0.5
+        logger.warning("AI engine unavailable, using fallback probability: %s", exc)
+        return FALLBACK_PROBABILITY, True
@@ -21,6 +21,10 @@ class TradeExecutionBlockedError(RuntimeError):
     pass
 
 
+class EtoroApiError(RuntimeError):
+    pass
+
+
 class EtoroClient:
     def __init__(self) -> None:
         self.settings = get_settings()
@@ -40,9 +44,18 @@ class EtoroClient:
         if datetime.utcnow() >= self._expires_at:
             await self._refresh_token()
 
+        if self.settings.etoro_http_enabled:
+            try:
+                async with httpx.AsyncClient(base_url=self.settings.etoro_base_url, timeout=20) as client:
+                    response = await client.request(
+                        method, endpoint, params=params, headers={"Authorization": f"Bearer {self._token}"}
+                    )
+                    response.raise_for_status()
+                    return response.json()
+            except (httpx.HTTPError, ValueError) as exc:
+                raise EtoroApiError(f"eToro API request failed: {exc}") from exc
+
         # Simulierter read-only API Zugriff. Kann durch echtes OAuth2-Flow ergänzt werden.
-        async with httpx.AsyncClient(timeout=20) as client:
-            _ = client
         return {"endpoint": endpoint, "params": params or {}, "token": self._token or "bootstrap-token"}
 
     async def get_account(self) -> dict:
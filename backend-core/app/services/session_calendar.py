@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+BASE_TZ = "Europe/Berlin"
+OFF_SESSION_SCORE = 0.2
+
+MINUTE_NS = 60 * 1_000_000_000
+DAY_NS = 24 * 60 * MINUTE_NS
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+
+@dataclass(frozen=True)
+class SessionWindow:
+    name: str
+    tz: str
+    start: time
+    end: time
+    score: float
+
+    @property
+    def start_minute(self) -> int:
+        return self.start.hour * 60 + self.start.minute
+
+    @property
+    def end_minute(self) -> int:
+        return self.end.hour * 60 + self.end.minute
+
+
+# Fenster in lokaler Börsenzeit, damit DST-Umstellungen der jeweiligen Zeitzone greifen.
+# London 06:00-10:30 und New York 08:00-12:30 entsprechen den bisherigen Berlin-Fenstern 07:00-11:30 / 14:00-18:30.
+SESSIONS = (
+    SessionWindow("london", "Europe/London", time(6, 0), time(10, 30), 1.0),
+    SessionWindow("new_york", "America/New_York", time(8, 0), time(12, 30), 1.0),
+)
+
+# Tokyo nur als Maske: das AI-Modell ist auf session_score in {0.2, 1.0} trainiert, ein eigener Tokyo-Score
+# würde die Feature-Verteilung verschieben.
+MASK_ONLY_SESSIONS = (
+    SessionWindow("tokyo", "Asia/Tokyo", time(9, 0), time(15, 0), OFF_SESSION_SCORE),
+)
+
+
+def _easter_sunday(year: int) -> date:
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    ell = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * ell) // 451
+    month, day = divmod(h + ell - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _substitute_forward(days: Iterable[date]) -> set[date]:
+    observed: set[date] = set()
+    for day in sorted(days):
+        while day.weekday() >= SAT or day in observed:
+            day += timedelta(days=1)
+        observed.add(day)
+    return observed
+
+
+def _nearest_weekday(day: date) -> date:
+    if day.weekday() == SAT:
+        return day - timedelta(days=1)
+    if day.weekday() == SUN:
+        return day + timedelta(days=1)
+    return day
+
+
+# Regelmäßige Börsenfeiertage nach den jeweiligen Regeln plus bekannte Einmal-Schließungen bis 2025.
+# Künftige Ad-hoc-Schließungen (Staatstrauer, Unwetter) sind naturgemäß nicht enthalten.
+LONDON_EARLY_MAY_MOVED = {1995: date(1995, 5, 8), 2020: date(2020, 5, 8)}
+LONDON_SPRING_MOVED = {2002: date(2002, 6, 4), 2012: date(2012, 6, 4), 2022: date(2022, 6, 2)}
+LONDON_SPECIAL = {
+    date(1999, 12, 31),
+    date(2002, 6, 3),
+    date(2011, 4, 29),
+    date(2012, 6, 5),
+    date(2022, 6, 3),
+    date(2022, 9, 19),
+    date(2023, 5, 8),
+}
+
+NEW_YORK_SPECIAL = {
+    date(1994, 4, 27),
+    date(2001, 9, 11),
+    date(2001, 9, 12),
+    date(2001, 9, 13),
+    date(2001, 9, 14),
+    date(2004, 6, 11),
+    date(2007, 1, 2),
+    date(2012, 10, 29),
+    date(2012, 10, 30),
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+}
+
+TOKYO_SPECIAL = {
+    date(1990, 11, 12),
+    date(1993, 6, 9),
+    date(2019, 4, 30),
+    date(2019, 5, 1),
+    date(2019, 5, 2),
+    date(2019, 10, 22),
+}
+# Olympia-Verschiebungen 2020/2021: Marine Day, Sports Day und Mountain Day.
+TOKYO_MOVED = {
+    2020: {"marine": date(2020, 7, 23), "sports": date(2020, 7, 24), "mountain": date(2020, 8, 10)},
+    2021: {"marine": date(2021, 7, 22), "sports": date(2021, 7, 23), "mountain": date(2021, 8, 8)},
+}
+
+
+def _london_holidays(year: int) -> set[date]:
+    easter = _easter_sunday(year)
+    fixed = _substitute_forward([date(year, 1, 1), date(year, 12, 25), date(year, 12, 26)])
+    return fixed | {
+        easter - timedelta(days=2),
+        easter + timedelta(days=1),
+        LONDON_EARLY_MAY_MOVED.get(year, _nth_weekday(year, 5, MON, 1)),
+        LONDON_SPRING_MOVED.get(year, _last_weekday(year, 5, MON)),
+        _last_weekday(year, 8, MON),
+    } | {day for day in LONDON_SPECIAL if day.year == year}
+
+
+def _new_york_holidays(year: int) -> set[date]:
+    easter = _easter_sunday(year)
+    days = {
+        easter - timedelta(days=2),
+        _nth_weekday(year, 2, MON, 3),
+        _last_weekday(year, 5, MON),
+        _nearest_weekday(date(year, 7, 4)),
+        _nth_weekday(year, 9, MON, 1),
+        _nth_weekday(year, 11, THU, 4),
+        _nearest_weekday(date(year, 12, 25)),
+    }
+    # NYSE verlegt Neujahr nicht auf den Freitag davor, nur von Sonntag auf Montag.
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != SAT:
+        days.add(_nearest_weekday(new_year))
+    if year >= 1998:
+        days.add(_nth_weekday(year, 1, MON, 3))
+    if year >= 2022:
+        days.add(_nearest_weekday(date(year, 6, 19)))
+    return days | {day for day in NEW_YORK_SPECIAL if day.year == year}
+
+
+def _equinox_day(year: int, base: float) -> int:
+    # Näherungsformel des japanischen Kabinettsamts, gültig 1980-2099.
+    return int(base + 0.242194 * (year - 1980) - (year - 1980) // 4)
+
+
+def _japan_national_holidays(year: int) -> set[date]:
+    moved = TOKYO_MOVED.get(year, {})
+    days = {
+        date(year, 1, 1),
+        date(year, 1, 15) if year < 2000 else _nth_weekday(year, 1, MON, 2),
+        date(year, 2, 11),
+        date(year, 3, _equinox_day(year, 20.8431)),
+        date(year, 4, 29),
+        date(year, 5, 3),
+        date(year, 5, 5),
+        date(year, 9, 15) if year < 2003 else _nth_weekday(year, 9, MON, 3),
+        date(year, 9, _equinox_day(year, 23.2488)),
+        date(year, 11, 3),
+        date(year, 11, 23),
+    }
+    if year >= 2007:
+        days.add(date(year, 5, 4))
+    if year <= 2018:
+        days.add(date(year, 12, 23))
+    elif year >= 2020:
+        days.add(date(year, 2, 23))
+    if year >= 1996:
+        days.add(moved.get("marine", date(year, 7, 20) if year < 2003 else _nth_weekday(year, 7, MON, 3)))
+    if year >= 2016:
+        days.add(moved.get("mountain", date(year, 8, 11)))
+    days.add(moved.get("sports", date(year, 10, 10) if year < 2000 else _nth_weekday(year, 10, MON, 2)))
+    days |= {day for day in TOKYO_SPECIAL if day.year == year}
+
+    # Brückentag zwischen zwei Feiertagen (vor 2007 auch der 4. Mai, danach z. B. Silver Week im September).
+    # Als Brückentag erhält er auf einem Sonntag keinen Ersatzfeiertag.
+    gaps = {day + timedelta(days=1) for day in days if day + timedelta(days=2) in days}
+    bridges = {gap for gap in gaps if gap.weekday() != SUN}
+    # Ersatzfeiertag für Feiertage am Sonntag: ab 2007 der nächste Nicht-Feiertag, davor nur der folgende Montag.
+    for day in sorted(d for d in days if d.weekday() == SUN):
+        substitute = day + timedelta(days=1)
+        if year >= 2007:
+            while substitute in days or substitute in bridges:
+                substitute += timedelta(days=1)
+        days.add(substitute)
+    return days | bridges
+
+
+def _tokyo_holidays(year: int) -> set[date]:
+    # Die TSE ist zusätzlich vom 31.12. bis 3.1. geschlossen.
+    return _japan_national_holidays(year) | {date(year, 1, 2), date(year, 1, 3), date(year, 12, 31)}
+
+
+HOLIDAY_RULES = {
+    "london": _london_holidays,
+    "new_york": _new_york_holidays,
+    "tokyo": _tokyo_holidays,
+}
+
+
+def _is_weekend(days: np.ndarray) -> np.ndarray:
+    # 1970-01-01 war ein Donnerstag (weekday 3).
+    return (days + 3) % 7 >= 5
+
+
+class SessionCalendar:
+    def __init__(
+        self,
+        sessions: tuple[SessionWindow, ...] = SESSIONS,
+        mask_only_sessions: tuple[SessionWindow, ...] = MASK_ONLY_SESSIONS,
+        first_year: int = 1990,
+        last_year: int = 2060,
+        off_session_score: float = OFF_SESSION_SCORE,
+    ) -> None:
+        self.sessions = sessions
+        self.mask_only_sessions = mask_only_sessions
+        self.off_session_score = off_session_score
+        self._first_day = date(first_year, 1, 1).toordinal() - EPOCH_ORDINAL
+        all_days = np.arange(self._first_day, date(last_year, 12, 31).toordinal() - EPOCH_ORDINAL + 1)
+        weekend = _is_weekend(all_days)
+        # Geschlossene Tage (Wochenende + Feiertage) je Session einmalig als Lookup-Tabelle vorberechnen.
+        self._closed: dict[str, np.ndarray] = {}
+        for session in (*sessions, *mask_only_sessions):
+            closed = weekend.copy()
+            rule = HOLIDAY_RULES.get(session.name)
+            if rule is not None:
+                for year in range(first_year, last_year + 1):
+                    for holiday in rule(year):
+                        closed[holiday.toordinal() - EPOCH_ORDINAL - self._first_day] = True
+            self._closed[session.name] = closed
+
+    def _closed_days(self, session: SessionWindow, days: np.ndarray) -> np.ndarray:
+        table = self._closed[session.name]
+        pos = days - self._first_day
+        in_range = (pos >= 0) & (pos < len(table))
+        return np.where(in_range, table[np.clip(pos, 0, len(table) - 1)], _is_weekend(days))
+
+    @staticmethod
+    def _to_index(timestamps, naive_tz: str) -> pd.DatetimeIndex:
+        try:
+            index = pd.DatetimeIndex(timestamps)
+        except ValueError as exc:
+            # Tz-aware Zeitstempel aus verschiedenen Zeitzonen (z. B. UTC- und Berlin-Zeilen) auf UTC vereinheitlichen.
+            values = list(timestamps)
+            if any(not pd.isna(value) and pd.Timestamp(value).tz is None for value in values):
+                raise ValueError("naive and tz-aware timestamps cannot be mixed") from exc
+            index = pd.DatetimeIndex(pd.to_datetime(values, utc=True))
+        if index.tz is None:
+            # Mehrdeutige Herbst-Stunde wie zoneinfo (fold=0) als Sommerzeit interpretieren.
+            index = index.tz_localize(naive_tz, ambiguous=np.ones(len(index), dtype=bool), nonexistent="shift_forward")
+        return index
+
+    def _masks(self, index: pd.DatetimeIndex, sessions: tuple[SessionWindow, ...]) -> dict[str, np.ndarray]:
+        valid = ~index.isna()
+        masks = {}
+        for session in sessions:
+            wall = index.tz_convert(session.tz).tz_localize(None).asi8
+            days = wall // DAY_NS
+            minute = (wall - days * DAY_NS) // MINUTE_NS
+            in_window = (minute >= session.start_minute) & (minute <= session.end_minute)
+            masks[session.name] = valid & in_window & ~self._closed_days(session, days)
+        return masks
+
+    def session_masks(self, timestamps, naive_tz: str = BASE_TZ) -> pd.DataFrame:
+        index = self._to_index(timestamps, naive_tz)
+        return pd.DataFrame(self._masks(index, (*self.sessions, *self.mask_only_sessions)), index=index)
+
+    def session_scores(self, timestamps, naive_tz: str = BASE_TZ) -> np.ndarray:
+        index = self._to_index(timestamps, naive_tz)
+        scores = np.full(len(index), self.off_session_score, dtype=float)
+        for session, mask in zip(self.sessions, self._masks(index, self.sessions).values()):
+            scores = np.where(mask, np.maximum(scores, session.score), scores)
+        scores[index.isna()] = np.nan
+        return scores
+
+    def session_score(self, moment: datetime, naive_tz: str = BASE_TZ) -> float:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=ZoneInfo(naive_tz))
+        score = self.off_session_score
+        for session in self.sessions:
+            local = moment.astimezone(ZoneInfo(session.tz))
+            minute = local.hour * 60 + local.minute
+            if not session.start_minute <= minute <= session.end_minute:
+                continue
+            day = np.array([local.toordinal() - EPOCH_ORDINAL])
+            if not self._closed_days(session, day)[0]:
+                score = max(score, session.score)
+        return score
+
+
+@lru_cache
+def get_session_calendar() -> SessionCalendar:
+    return SessionCalendar()
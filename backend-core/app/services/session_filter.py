@@ -1,12 +1,16 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+from app.services.session_calendar import BASE_TZ, get_session_calendar
+
 
 def get_session_score(now: datetime | None = None) -> float:
-    current = now or datetime.now(ZoneInfo("Europe/Berlin"))
-    minute = current.hour * 60 + current.minute
-    london = 7 * 60 <= minute <= 11 * 60 + 30
-    ny = 14 * 60 <= minute <= 18 * 60 + 30
-    if london or ny:
-        return 1.0
-    return 0.2
+    current = now or datetime.now(ZoneInfo(BASE_TZ))
+    return get_session_calendar().session_score(current)
+
+
+def get_session_scores(timestamps, naive_tz: str = BASE_TZ) -> np.ndarray:
+    # Vektorisierte Variante für Backtests/Trainingsdaten; naive Zeitstempel gelten wie bei get_session_score als Europe/Berlin.
+    return get_session_calendar().session_scores(timestamps, naive_tz=naive_tz)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+from loadtest.stubs import StubConfig
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+ENDPOINTS = {
+    "analyze": ("POST", "/analyze"),
+    "signals": ("GET", "/signals"),
+    "positions": ("GET", "/positions"),
+}
+
+logger = logging.getLogger("loadtest")
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    latency: float
+    status: int
+    ai_fallback: bool = False
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_healthy(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} exited with code {process.returncode} during startup")
+        try:
+            if httpx.get(f"{url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{url} did not become healthy within {timeout}s")
+
+
+@contextmanager
+def _serve(target: str, env: dict[str, str], workers: int = 1):
+    port = _free_port()
+    command = [sys.executable, "-m", "uvicorn", target, "--host", "127.0.0.1", "--port", str(port)]
+    command += ["--log-level", "warning", "--workers", str(workers)]
+    if target.startswith("loadtest.stubs:"):
+        command.append("--factory")
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env={**os.environ, **env})
+    url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_healthy(url, process)
+        logger.info("Started %s on %s", target, url)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+@contextmanager
+def local_stack(etoro: StubConfig, ai: StubConfig, database_url: str | None = None, backend_workers: int = 1):
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as tmp:
+        with _serve("loadtest.stubs:create_etoro_app", etoro.to_env("LOADTEST_ETORO")) as etoro_url, _serve(
+            "loadtest.stubs:create_ai_app", ai.to_env("LOADTEST_AI")
+        ) as ai_url:
+            backend_env = {
+                "ANALYSIS_MODE_ONLY": "true",
+                "DATABASE_URL": database_url or f"sqlite:///{tmp}/loadtest.db",
+                "AI_ENGINE_URL": ai_url,
+                "ETORO_BASE_URL": etoro_url,
+                "ETORO_HTTP_ENABLED": "true",
+            }
+            with _serve("app.main:app", backend_env, workers=backend_workers) as backend_url:
+                yield {"backend": backend_url, "etoro": etoro_url, "ai": ai_url}
+
+
+async def _call(client: httpx.AsyncClient, endpoint: str) -> Sample:
+    method, path = ENDPOINTS[endpoint]
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, path)
+    except httpx.HTTPError:
+        return Sample(endpoint, time.perf_counter() - started, 0)
+    latency = time.perf_counter() - started
+    ai_fallback = endpoint == "analyze" and response.is_success and response.json()["signal"].get("ai_fallback", False)
+    return Sample(endpoint, latency, response.status_code, ai_fallback)
+
+
+async def drive(
+    base_url: str,
+    mix: dict[str, float],
+    concurrency: int,
+    total_requests: int | None = None,
+    duration: float | None = None,
+    seed: int = 42,
+) -> tuple[list[Sample], float]:
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    samples: list[Sample] = []
+    issued = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+
+        async def worker() -> None:
+            nonlocal issued
+            while True:
+                if total_requests is not None and issued >= total_requests:
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                issued += 1
+                samples.append(await _call(client, rng.choices(names, weights)[0]))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return samples, elapsed
+
+
+async def fetch_upstream_counts(stub_urls: dict[str, str]) -> dict[str, Counter]:
+    counts = {}
+    async with httpx.AsyncClient(timeout=5) as client:
+        for name, url in stub_urls.items():
+            response = await client.get(f"{url}/stats")
+            response.raise_for_status()
+            counts[name] = Counter(response.json()["status_counts"])
+    return counts
+
+
+def summarize(samples: list[Sample], elapsed: float, upstream: dict[str, Counter] | None = None) -> dict:
+    def stats(group: list[Sample]) -> dict:
+        latencies_ms = np.array([s.latency * 1000 for s in group])
+        ok = [s for s in group if 200 <= s.status < 300]
+        p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99]) if len(group) else (0.0, 0.0, 0.0)
+        return {
+            "requests": len(group),
+            "errors": len(group) - len(ok),
+            "error_rate": (len(group) - len(ok)) / len(group) if group else 0.0,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "throughput_rps": len(group) / elapsed if elapsed else 0.0,
+            "status_counts": dict(sorted(Counter(str(s.status) for s in group).items())),
+        }
+
+    report = {"elapsed_s": elapsed, "overall": stats(samples), "endpoints": {}}
+    for endpoint in sorted({s.endpoint for s in samples}):
+        report["endpoints"][endpoint] = stats([s for s in samples if s.endpoint == endpoint])
+
+    analyzed = [s for s in samples if s.endpoint == "analyze" and 200 <= s.status < 300]
+    report["ai_fallback_rate"] = sum(s.ai_fallback for s in analyzed) / len(analyzed) if analyzed else 0.0
+
+    # Upstream-Statuscodes der Stand-ins, da 429 und 503 im Backend beide als 502 bzw. Fallback ankommen.
+    report["upstream"] = {}
+    for name, counts in (upstream or {}).items():
+        total = sum(counts.values())
+        errors = sum(n for status, n in counts.items() if int(status) >= 500)
+        report["upstream"][name] = {
+            "requests": total,
+            "rate_limited": counts.get("429", 0),
+            "rate_limited_rate": counts.get("429", 0) / total if total else 0.0,
+            "errors": errors,
+            "error_rate": errors / total if total else 0.0,
+            "status_counts": dict(sorted(counts.items())),
+        }
+    return report
+
+
+def format_report(report: dict) -> str:
+    header = f"{'endpoint':<10} {'requests':>8} {'errors':>7} {'err%':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}"
+    lines = [header, "-" * len(header)]
+    rows = [*report["endpoints"].items(), ("overall", report["overall"])]
+    for name, row in rows:
+        lines.append(
+            f"{name:<10} {row['requests']:>8} {row['errors']:>7} {row['error_rate'] * 100:>5.1f}% "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['throughput_rps']:>8.1f}"
+        )
+    lines.append(f"elapsed {report['elapsed_s']:.1f}s, AI fallback rate {report['ai_fallback_rate'] * 100:.1f}%")
+    for name, row in report["upstream"].items():
+        lines.append(
+            f"upstream {name}: {row['requests']} requests, {row['rate_limited']} rate-limited "
+            f"({row['rate_limited_rate'] * 100:.1f}%), {row['errors']} errors ({row['error_rate'] * 100:.1f}%)"
+        )
+    return "\n".join(lines)
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {name!r}, expected one of {sorted(ENDPOINTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Offline end-to-end load test against local eToro/AI stand-ins")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000, help="total requests (ignored if --duration is set)")
+    parser.add_argument("--duration", type=float, default=None, help="run for N seconds instead of a fixed count")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--mix", type=_parse_mix, default="analyze=1,signals=2,positions=2")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--backend-url", default=None, help="use an already running backend instead of the local stack")
+    parser.add_argument("--database-url", default=None, help="defaults to a temporary SQLite database")
+    parser.add_argument("--backend-workers", type=int, default=1)
+    parser.add_argument("--etoro-latency-ms", type=float, default=80.0)
+    parser.add_argument("--etoro-jitter-ms", type=float, default=40.0)
+    parser.add_argument("--etoro-error-rate", type=float, default=0.01)
+    parser.add_argument("--etoro-rate-limit", type=float, default=0.0, help="requests per second, 0 = unlimited")
+    parser.add_argument("--ai-latency-ms", type=float, default=30.0)
+    parser.add_argument("--ai-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--ai-error-rate", type=float, default=0.02)
+    parser.add_argument("--ai-rate-limit", type=float, default=0.0, help="requests per second, 0 = unlimited")
+    parser.add_argument("--json", type=Path, default=None, help="write the report as JSON to this path")
+    return parser
+
+
+async def _run(base_url: str, args: argparse.Namespace, stub_urls: dict[str, str] | None = None) -> dict:
+    if args.warmup:
+        await drive(base_url, args.mix, min(args.concurrency, args.warmup), total_requests=args.warmup, seed=args.seed)
+    before = await fetch_upstream_counts(stub_urls) if stub_urls else {}
+    total = None if args.duration else args.requests
+    samples, elapsed = await drive(base_url, args.mix, args.concurrency, total, args.duration, args.seed)
+    after = await fetch_upstream_counts(stub_urls) if stub_urls else {}
+    return summarize(samples, elapsed, {name: after[name] - before[name] for name in after})
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    args = build_parser().parse_args(argv)
+    if args.backend_url:
+        report = asyncio.run(_run(args.backend_url, args))
+    else:
+        etoro = StubConfig(args.etoro_latency_ms, args.etoro_jitter_ms, args.etoro_error_rate, args.etoro_rate_limit)
+        ai = StubConfig(args.ai_latency_ms, args.ai_jitter_ms, args.ai_error_rate, args.ai_rate_limit)
+        with local_stack(etoro, ai, args.database_url, args.backend_workers) as urls:
+            report = asyncio.run(_run(urls["backend"], args, {"etoro": urls["etoro"], "ai": urls["ai"]}))
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rps: float = 0.0
+
+    @classmethod
+    def from_env(cls, prefix: str) -> StubConfig:
+        return cls(
+            latency_ms=float(os.getenv(f"{prefix}_LATENCY_MS", 0)),
+            jitter_ms=float(os.getenv(f"{prefix}_JITTER_MS", 0)),
+            error_rate=float(os.getenv(f"{prefix}_ERROR_RATE", 0)),
+            rate_limit_rps=float(os.getenv(f"{prefix}_RATE_LIMIT_RPS", 0)),
+        )
+
+    def to_env(self, prefix: str) -> dict[str, str]:
+        return {
+            f"{prefix}_LATENCY_MS": str(self.latency_ms),
+            f"{prefix}_JITTER_MS": str(self.jitter_ms),
+            f"{prefix}_ERROR_RATE": str(self.error_rate),
+            f"{prefix}_RATE_LIMIT_RPS": str(self.rate_limit_rps),
+        }
+
+
+class FixedWindowLimiter:
+    def __init__(self, rps: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rps = rps
+        self.clock = clock
+        self._window = 0
+        self._count = 0
+
+    def allow(self) -> bool:
+        if self.rps <= 0:
+            return True
+        window = int(self.clock())
+        if window != self._window:
+            self._window = window
+            self._count = 0
+        self._count += 1
+        return self._count <= self.rps
+
+
+def _install_fault_injection(app: FastAPI, config: StubConfig) -> None:
+    limiter = app.state.limiter = FixedWindowLimiter(config.rate_limit_rps)
+    app.state.status_counts = Counter()
+
+    @app.middleware("http")
+    async def inject(request: Request, call_next):
+        if request.url.path in {"/health", "/stats"}:
+            return await call_next(request)
+        if not limiter.allow():
+            response = JSONResponse({"detail": "rate limit exceeded"}, status_code=429, headers={"Retry-After": "1"})
+        else:
+            delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+            if delay > 0:
+                await asyncio.sleep(delay / 1000)
+            if random.random() < config.error_rate:
+                response = JSONResponse({"detail": "injected error"}, status_code=503)
+            else:
+                response = await call_next(request)
+        app.state.status_counts[str(response.status_code)] += 1
+        return response
+
+    @app.get("/stats")
+    async def stats() -> dict:
+        return {"status_counts": dict(app.state.status_counts)}
+
+
+def create_etoro_app() -> FastAPI:
+    config = StubConfig.from_env("LOADTEST_ETORO")
+    app = FastAPI(title="eToro API stand-in")
+    _install_fault_injection(app, config)
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok", "service": "etoro-stub"}
+
+    @app.get("/account")
+    async def account() -> dict:
+        return {"accountId": "loadtest", "currency": "EUR", "equity": 10000.0, "balance": 10000.0}
+
+    @app.get("/portfolio")
+    async def portfolio() -> dict:
+        return {"positions": [], "equity": 10000.0}
+
+    @app.get("/positions")
+    async def positions() -> dict:
+        return {
+            "positions": [
+                {"instrument": "EURJPY", "direction": "LONG", "units": 1000, "openRate": 160.12, "pnl": 4.2},
+            ]
+        }
+
+    @app.get("/instruments")
+    async def instruments() -> dict:
+        return {"instruments": [{"symbol": "EURJPY", "precision": 3}]}
+
+    @app.get("/market-data/candles")
+    async def candles(symbol: str = "EURJPY", tf: str = "M15", limit: int = 400) -> dict:
+        now = time.time()
+        price = 160.0
+        rows = []
+        for i in range(limit):
+            price += random.gauss(0, 0.05)
+            rows.append({"time": now - (limit - i) * 900, "open": price, "high": price + 0.02, "low": price - 0.02, "close": price})
+        return {"symbol": symbol, "tf": tf, "candles": rows}
+
+    @app.api_route("/{path:path}", methods=["POST", "PUT", "DELETE", "PATCH"])
+    async def reject_writes(path: str):
+        raise HTTPException(status_code=403, detail="Stand-in is read-only")
+
+    return app
+
+
+def create_ai_app() -> FastAPI:
+    config = StubConfig.from_env("LOADTEST_AI")
+    app = FastAPI(title="AI engine stand-in")
+    _install_fault_injection(app, config)
+
+    @app.get("/health")
+    def health() -> dict:
+        return {"status": "ok", "service": "ai-engine-stub", "model_exists": True}
+
+    @app.post("/infer")
+    async def infer(payload: dict) -> dict:
+        features = payload.get("features", {})
+        # Deterministisch aus den Features, damit Läufe vergleichbar bleiben.
+        probability = min(0.99, 0.4 + 0.3 * float(features.get("session_score", 0.0)) + 0.1 * float(features.get("m15_bos_bull", 0)))
+        return {"probability": probability, "show_signal": probability > 0.72}
+
+    return app
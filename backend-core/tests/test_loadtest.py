@@ -0,0 +1,85 @@
+import argparse
+
+import pytest
+from fastapi.testclient import TestClient
+
+from loadtest.harness import Sample, _parse_mix, format_report, summarize
+from loadtest.stubs import FixedWindowLimiter, create_ai_app, create_etoro_app
+
+
+def test_parse_mix_defaults_weight_to_one():
+    assert _parse_mix("analyze=2,signals,positions=0.5") == {"analyze": 2.0, "signals": 1.0, "positions": 0.5}
+
+
+def test_parse_mix_rejects_unknown_endpoint():
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_mix("analyze=1,orders=1")
+
+
+def test_summarize_percentiles_errors_and_fallback_rate():
+    samples = [Sample("signals", latency / 1000, 200) for latency in range(1, 101)]
+    samples += [
+        Sample("analyze", 0.2, 200, ai_fallback=True),
+        Sample("analyze", 0.4, 200),
+        Sample("analyze", 0.6, 200),
+        Sample("analyze", 0.8, 200, ai_fallback=True),
+        Sample("positions", 0.1, 502),
+        Sample("positions", 0.3, 0),
+    ]
+    report = summarize(samples, elapsed=2.0)
+
+    signals = report["endpoints"]["signals"]
+    assert signals["p50_ms"] == pytest.approx(50.5)
+    assert signals["p99_ms"] == pytest.approx(99.01)
+    assert signals["throughput_rps"] == 50.0
+    assert report["endpoints"]["positions"]["errors"] == 2
+    assert report["endpoints"]["positions"]["status_counts"] == {"0": 1, "502": 1}
+    assert report["overall"]["requests"] == 106
+    assert report["ai_fallback_rate"] == 0.5
+    assert "AI fallback rate 50.0%" in format_report(report)
+
+
+def test_summarize_separates_upstream_rate_limits_from_errors():
+    upstream = {"etoro": {"200": 6, "429": 3, "503": 1}}
+    report = summarize([Sample("positions", 0.1, 502)], elapsed=1.0, upstream=upstream)
+    etoro = report["upstream"]["etoro"]
+    assert (etoro["requests"], etoro["rate_limited"], etoro["errors"]) == (10, 3, 1)
+    assert etoro["rate_limited_rate"] == 0.3
+    assert "upstream etoro: 10 requests, 3 rate-limited" in format_report(report)
+
+
+def test_fixed_window_limiter_resets_each_second():
+    now = [100.2]
+    limiter = FixedWindowLimiter(rps=2, clock=lambda: now[0])
+    assert [limiter.allow() for _ in range(3)] == [True, True, False]
+    now[0] = 101.0
+    assert limiter.allow()
+
+
+def test_fixed_window_limiter_disabled_when_zero():
+    limiter = FixedWindowLimiter(rps=0)
+    assert all(limiter.allow() for _ in range(1000))
+
+
+def test_stub_injects_errors_and_counts_statuses(monkeypatch):
+    monkeypatch.setenv("LOADTEST_AI_ERROR_RATE", "1")
+    client = TestClient(create_ai_app())
+    assert client.post("/infer", json={"features": {}}).status_code == 503
+    assert client.get("/health").status_code == 200
+    assert client.get("/stats").json() == {"status_counts": {"503": 1}}
+
+
+def test_stub_rate_limit_returns_429(monkeypatch):
+    monkeypatch.setenv("LOADTEST_ETORO_RATE_LIMIT_RPS", "1")
+    app = create_etoro_app()
+    app.state.limiter.clock = lambda: 5.0
+    client = TestClient(app)
+    assert client.get("/positions").status_code == 200
+    response = client.get("/positions")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert client.get("/stats").json() == {"status_counts": {"200": 1, "429": 1}}
+
+
+def test_etoro_stub_is_read_only():
+    assert TestClient(create_etoro_app()).post("/orders").status_code == 403
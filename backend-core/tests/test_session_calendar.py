@@ -0,0 +1,113 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.session_calendar import SessionCalendar, _easter_sunday, _new_york_holidays
+from app.services.session_filter import get_session_score, get_session_scores
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    ("year", "expected"),
+    [(2000, date(2000, 4, 23)), (2019, date(2019, 4, 21)), (2024, date(2024, 3, 31)), (2025, date(2025, 4, 20))],
+)
+def test_easter_sunday(year, expected):
+    assert _easter_sunday(year) == expected
+
+
+def test_us_eu_dst_mismatch_week_follows_new_york_local_time():
+    # 2024-03-12: New York bereits auf Sommerzeit, Berlin noch nicht -> NY öffnet 13:00 Berlin.
+    assert get_session_score(datetime(2024, 3, 12, 13, 30, tzinfo=BERLIN)) == 1.0
+    assert get_session_score(datetime(2024, 3, 12, 18, 0, tzinfo=BERLIN)) == 0.2
+    assert get_session_score(datetime(2024, 4, 12, 18, 0, tzinfo=BERLIN)) == 1.0
+
+
+@pytest.mark.parametrize(
+    "moment",
+    [
+        datetime(2024, 5, 27, 15, 0),  # Memorial Day + UK Spring bank holiday
+        datetime(2024, 9, 2, 15, 0),  # Labor Day
+        datetime(2024, 6, 19, 15, 0),  # Juneteenth
+        datetime(2024, 12, 25, 8, 0),
+        datetime(2024, 6, 15, 8, 0),  # Samstag
+    ],
+)
+def test_closed_days_score_off_session(moment):
+    assert get_session_score(moment) == 0.2
+    assert get_session_scores([moment])[0] == 0.2
+
+
+def test_new_york_does_not_observe_saturday_new_year_on_friday():
+    assert date(2021, 12, 31) not in _new_york_holidays(2022)
+    assert get_session_score(datetime(2021, 12, 31, 15, 0)) == 1.0
+
+
+def test_naive_timestamps_use_same_default_for_scalar_and_batch():
+    moment = datetime(2024, 3, 12, 6, 30)
+    assert get_session_scores([moment])[0] == get_session_score(moment)
+
+
+def test_scalar_and_vectorized_agree_on_tz_aware_input():
+    index = pd.date_range("2023-10-27", "2024-04-03", freq="17min", tz="UTC")
+    calendar = SessionCalendar()
+    scalar = np.array([calendar.session_score(ts.to_pydatetime()) for ts in index])
+    np.testing.assert_array_equal(calendar.session_scores(index), scalar)
+
+
+def test_outside_precomputed_range_falls_back_to_weekends():
+    calendar = SessionCalendar(first_year=2024, last_year=2024)
+    moments = [datetime(2030, 12, 25, 8, 0), datetime(2030, 12, 28, 8, 0)]
+    assert calendar.session_scores(moments).tolist() == [1.0, 0.2]
+
+
+def test_nonexistent_and_ambiguous_local_times_are_localized():
+    # 02:30 existiert am 31.03.2024 in Berlin nicht, 02:30 am 27.10.2024 doppelt.
+    scores = get_session_scores([datetime(2024, 3, 31, 2, 30), datetime(2024, 10, 27, 2, 30)])
+    assert scores.tolist() == [0.2, 0.2]
+
+
+def test_nat_scores_nan_and_masks_false():
+    calendar = SessionCalendar()
+    stamps = pd.DatetimeIndex([pd.NaT, pd.Timestamp("2024-06-12 08:00")])
+    scores = calendar.session_scores(stamps)
+    assert np.isnan(scores[0]) and scores[1] == 1.0
+    assert not calendar.session_masks(stamps).iloc[0].any()
+
+
+def test_tokyo_is_masked_but_not_scored():
+    calendar = SessionCalendar()
+    moment = pd.Timestamp("2024-06-12 10:00", tz="Asia/Tokyo")
+    masks = calendar.session_masks([moment])
+    assert masks["tokyo"].iloc[0]
+    assert calendar.session_scores([moment])[0] == 0.2
+    assert not calendar.session_masks([pd.Timestamp("2024-09-16 10:00", tz="Asia/Tokyo")])["tokyo"].iloc[0]
+
+
+@pytest.mark.parametrize(
+    ("day", "closed"),
+    [
+        ("1992-05-06", False),  # 3. Mai Sonntag: vor 2007 nur Montag 4. Mai als Ersatz
+        ("1997-05-06", False),  # 4. Mai Sonntag als Brückentag ohne Ersatzfeiertag
+        ("2003-05-06", False),
+        ("1998-05-04", True),  # Brückentag zwischen 3. und 5. Mai
+        ("2008-05-06", True),  # ab 2007 Ersatz am nächsten Nicht-Feiertag
+    ],
+)
+def test_tokyo_substitute_holiday_rules_by_year(day, closed):
+    masks = SessionCalendar().session_masks([pd.Timestamp(f"{day} 10:00", tz="Asia/Tokyo")])
+    assert masks["tokyo"].iloc[0] == (not closed)
+
+
+def test_mixed_tz_aware_inputs_are_converted():
+    moments = [datetime(2024, 6, 12, 6, 0, tzinfo=ZoneInfo("UTC")), datetime(2024, 6, 12, 13, 0, tzinfo=BERLIN)]
+    scores = get_session_scores(moments)
+    assert scores.tolist() == [get_session_score(moment) for moment in moments] == [1.0, 0.2]
+
+
+def test_mixing_naive_and_aware_inputs_is_rejected():
+    with pytest.raises(ValueError, match="cannot be mixed"):
+        get_session_scores([datetime(2024, 6, 12, 6, 0, tzinfo=ZoneInfo("UTC")), datetime(2024, 6, 12, 8, 0)])